@@ -1,5 +1,6 @@
 # src/cli/app.py
 import argparse
+import importlib
 import sys
 from collections.abc import Sequence
 from pathlib import Path
@@ -9,6 +10,47 @@ from src.cli.output import ConsoleOutput
 from src.storage.abstract import AbstractStorage
 from src.storage.json_storage import StorageError
 
+# Registry of available subcommands. Command modules are imported lazily in
+# main() so that a single invocation only pays for the module it dispatches to.
+COMMANDS: dict[str, tuple[str, str]] = {
+    "add": ("src.cli.commands.add", "AddCommand"),
+    "delete": ("src.cli.commands.delete", "DeleteCommand"),
+    "list": ("src.cli.commands.list", "ListCommand"),
+    "search": ("src.cli.commands.search", "SearchCommand"),
+    "status": ("src.cli.commands.status", "StatusCommand"),
+}
+
+
+# Default storage location, resolved once at import instead of per run.
+_STORAGE_PATH = Path("data/books.json")
+
+# Pre-canned top-level help, printed without building the argparse tree
+# (subparser construction is a measurable share of CLI start-up).
+STATIC_HELP = """\
+usage: book-manager [-h] {add,delete,list,search,status} ...
+
+Book Manager CLI
+
+commands:
+  add       Add a new book to the library
+  delete    Delete a book from the library
+  list      List all books in the library
+  search    Search for books by title, author or year
+  status    Update a book's status
+
+options:
+  -h, --help  show this help message and exit
+"""
+
+
+def _load_command(name: str) -> type[BaseCommand]:
+    """Import and return the command class registered under ``name``."""
+    module_name, class_name = COMMANDS[name]
+    command_class: type[BaseCommand] = getattr(
+        importlib.import_module(module_name), class_name
+    )
+    return command_class
+
 
 class BookManagerCLI:
     """Main CLI application class."""
@@ -19,39 +61,47 @@ class BookManagerCLI:
         """Initialize CLI application."""
         self.storage = storage
         self.output = ConsoleOutput()
+        self.commands: dict[str, BaseCommand] = {
+            cmd.name: cmd for cmd in (commands or [])
+        }
 
-        self.parser = argparse.ArgumentParser(
+    def _build_parser(self, commands: Sequence[BaseCommand]) -> argparse.ArgumentParser:
+        """Build an argparse tree containing only the given commands."""
+        parser = argparse.ArgumentParser(
             description="Book Manager CLI",
             formatter_class=argparse.RawDescriptionHelpFormatter,
         )
-        self.subparsers = self.parser.add_subparsers(
-            dest="command", help="Available commands"
-        )
-
-        self._register_commands(commands or [])
-
-    def _register_commands(self, commands: Sequence[BaseCommand]) -> None:
-        """Register CLI commands."""
-        self.commands = {}
+        subparsers = parser.add_subparsers(dest="command", help="Available commands")
         for cmd in commands:
-            subparser = self.subparsers.add_parser(cmd.name)
+            subparser = subparsers.add_parser(cmd.name)
             cmd.configure(subparser)
-            self.commands[cmd.name] = cmd
+        return parser
 
     def run(self, args: list[str] | None = None) -> int:
         """Run the CLI application with the given arguments."""
         if not args:
-            self.parser.print_help(sys.stdout)
+            self._build_parser(list(self.commands.values())).print_help(sys.stdout)
             return 0
 
         try:
-            parsed_args = self.parser.parse_args(args)
+            requested = self.commands.get(args[0])
+            if requested is not None:
+                # A single invocation dispatches one subcommand, so only its
+                # subparser is worth configuring.
+                parser = self._build_parser([requested])
+            else:
+                # Unknown first token: register everything so argparse can
+                # produce its full help or "invalid choice" error.
+                parser = self._build_parser(list(self.commands.values()))
+
+            parsed_args = parser.parse_args(args)
             if not parsed_args.command:
-                self.parser.print_help(sys.stdout)
+                parser.print_help(sys.stdout)
                 return 0
 
             command = self.commands[parsed_args.command]
-            result = command.execute(parsed_args)
+            with self.storage.buffered():
+                result = command.execute(parsed_args)
             self.output.display(result)
 
             return 0 if result.success else 1
@@ -67,25 +117,27 @@ class BookManagerCLI:
 
 def main() -> None:
     """CLI entry point."""
+    if len(sys.argv) <= 1 or sys.argv[1] in {"-h", "--help"}:
+        # Fast path: no storage, no commands, no parser.
+        sys.stdout.write(STATIC_HELP)
+        sys.exit(0)
+
     try:
-        storage_path = Path("data/books.json")
-        storage_path.parent.mkdir(parents=True, exist_ok=True)
-
-        from src.cli.commands.add import AddCommand
-        from src.cli.commands.delete import DeleteCommand
-        from src.cli.commands.list import ListCommand
-        from src.cli.commands.search import SearchCommand
-        from src.cli.commands.status import StatusCommand
+        # Probing with a stat first is cheaper than an unconditional
+        # mkdirat; after the first run the directory always exists.
+        if not _STORAGE_PATH.parent.is_dir():
+            _STORAGE_PATH.parent.mkdir(parents=True, exist_ok=True)
+
         from src.storage.json_storage import JsonStorage
 
-        storage = JsonStorage(storage_path)
-        commands = [
-            AddCommand(storage),
-            DeleteCommand(storage),
-            ListCommand(storage),
-            SearchCommand(storage),
-            StatusCommand(storage),
-        ]
+        storage = JsonStorage(_STORAGE_PATH)
+
+        requested = sys.argv[1] if len(sys.argv) > 1 else None
+        # Known subcommand: import only its module.  Otherwise register
+        # everything so argparse can print the full help or its
+        # "invalid choice" error.
+        names = [requested] if requested in COMMANDS else list(COMMANDS)
+        commands = [_load_command(name)(storage) for name in names]
 
         app = BookManagerCLI(storage, commands)
         sys.exit(app.run(sys.argv[1:]))
@@ -1,13 +1,15 @@
 # src/cli/commands/add.py
+import json
+import sys
 from argparse import ArgumentParser, Namespace
+from collections.abc import Iterable
 from dataclasses import dataclass
 
 from src.cli.commands.base import BaseCommand, CommandResult
 from src.models.book import Book
-from src.storage.abstract import AbstractStorage
 
 
-@dataclass
+@dataclass(slots=True)
 class AddCommandResult(CommandResult):
     """Result of add command execution."""
 
@@ -15,27 +17,58 @@ class AddCommandResult(CommandResult):
 class AddCommand(BaseCommand):
     """Command for adding a new book to the library."""
 
-    def __init__(self, storage: AbstractStorage) -> None:
-        super().__init__()
-        self.storage = storage
-
     def configure(self, parser: ArgumentParser) -> None:
-        parser.add_argument("title", help="Book title")
-        parser.add_argument("author", help="Book author")
-        parser.add_argument("year", type=int, help="Publication year")
+        parser.add_argument("title", nargs="?", help="Book title")
+        parser.add_argument("author", nargs="?", help="Book author")
+        parser.add_argument("year", nargs="?", type=int, help="Publication year")
+        parser.add_argument(
+            "--stdin",
+            action="store_true",
+            help="Read books as newline-delimited JSON objects from stdin",
+        )
 
     def execute(self, args: Namespace) -> CommandResult:
         try:
+            if getattr(args, "stdin", False):
+                return self._execute_bulk(sys.stdin)
+
+            if args.title is None or args.author is None or args.year is None:
+                return AddCommandResult(
+                    success=False,
+                    message="Failed to add book: title, author and year are required",
+                )
+
             book = Book.create(title=args.title, author=args.author, year=args.year)
             self.storage.add(book)
 
             return AddCommandResult(
                 success=True,
-                message=f"Book '{book.title.value}' added successfully",
-                data=book.to_dict(),
+                message=f"Book '{book.title}' added successfully",
+                data=book.to_display_dict(),
             )
 
         except ValueError as e:
             return AddCommandResult(success=False, message=f"Failed to add book: {e!s}")
         except Exception as e:
             return AddCommandResult(success=False, message=f"Unexpected error: {e!s}")
+
+    def _execute_bulk(self, lines: Iterable[str]) -> CommandResult:
+        """Add every NDJSON record from ``lines`` in one batched write."""
+        books = []
+        for line in lines:
+            stripped = line.strip()
+            if not stripped:
+                continue
+            record = json.loads(stripped)
+            books.append(
+                Book.create(
+                    title=record["title"],
+                    author=record["author"],
+                    year=record["year"],
+                )
+            )
+        self.storage.bulk_add(books)
+        return AddCommandResult(
+            success=True,
+            message=f"Added {len(books)} books successfully",
+        )
@@ -5,8 +5,10 @@ from argparse import ArgumentParser, Namespace
 from dataclasses import dataclass
 from typing import Any
 
+from src.storage.abstract import AbstractStorage
 
-@dataclass
+
+@dataclass(slots=True)
 class CommandResult:
     """Base class for command execution results."""
 
@@ -18,8 +20,16 @@ class CommandResult:
 class BaseCommand(ABC):
     """Base class for all CLI commands."""
 
-    def __init__(self) -> None:
-        self.name = self.__class__.__name__.lower().replace("command", "")
+    name: str
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Derive the command name once per class instead of per instance."""
+        super().__init_subclass__(**kwargs)
+        if "name" not in cls.__dict__:
+            cls.name = cls.__name__.lower().replace("command", "")
+
+    def __init__(self, storage: AbstractStorage) -> None:
+        self.storage = storage
 
     @abstractmethod
     def configure(self, parser: ArgumentParser) -> None:
@@ -3,10 +3,9 @@ from argparse import ArgumentParser, Namespace
 from dataclasses import dataclass
 
 from src.cli.commands.base import BaseCommand, CommandResult
-from src.storage.abstract import AbstractStorage
 
 
-@dataclass
+@dataclass(slots=True)
 class DeleteCommandResult(CommandResult):
     """Result of delete command execution."""
 
@@ -14,10 +13,6 @@ class DeleteCommandResult(CommandResult):
 class DeleteCommand(BaseCommand):
     """Command for deleting a book from the library."""
 
-    def __init__(self, storage: AbstractStorage) -> None:
-        super().__init__()
-        self.storage = storage
-
     def configure(self, parser: ArgumentParser) -> None:
         parser.add_argument("book_id", help="Book ID to delete")
 
@@ -33,8 +28,8 @@ class DeleteCommand(BaseCommand):
 
             return DeleteCommandResult(
                 success=True,
-                message=f"Book '{book.title.value}' deleted successfully",
-                data=book.to_dict(),
+                message=f"Book '{book.title}' deleted successfully",
+                data=book.to_display_dict(),
             )
 
         except ValueError as e:
@@ -3,10 +3,9 @@ from argparse import ArgumentParser, Namespace
 from dataclasses import dataclass
 
 from src.cli.commands.base import BaseCommand, CommandResult
-from src.storage.abstract import AbstractStorage
 
 
-@dataclass
+@dataclass(slots=True)
 class ListCommandResult(CommandResult):
     """Result of list command execution."""
 
@@ -14,26 +13,25 @@ class ListCommandResult(CommandResult):
 class ListCommand(BaseCommand):
     """Command for listing all books in the library."""
 
-    def __init__(self, storage: AbstractStorage) -> None:
-        super().__init__()
-        self.storage = storage
-
     def configure(self, parser: ArgumentParser) -> None:
         pass  # No additional arguments needed
 
     def execute(self, args: Namespace) -> CommandResult:
         try:
-            books = self.storage.list_all()
+            # Listing only projects fields into a table, so the raw stored
+            # dicts are enough: no Book objects are constructed at all and
+            # the output layer formats timestamps on render.
+            data = [dict(book_data) for book_data in self.storage.iter_all_raw()]
 
-            if not books:
+            if not data:
                 return ListCommandResult(
                     success=True, message="No books found in the library", data=[]
                 )
 
             return ListCommandResult(
                 success=True,
-                message=f"Found {len(books)} books",
-                data=[book.to_dict() for book in books],
+                message=f"Found {len(data)} books",
+                data=data,
             )
 
         except Exception as e:
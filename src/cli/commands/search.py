@@ -3,10 +3,9 @@ from argparse import ArgumentParser, Namespace
 from dataclasses import dataclass
 
 from src.cli.commands.base import BaseCommand, CommandResult
-from src.storage.abstract import AbstractStorage
 
 
-@dataclass
+@dataclass(slots=True)
 class SearchCommandResult(CommandResult):
     """Result of search command execution."""
 
@@ -14,10 +13,6 @@ class SearchCommandResult(CommandResult):
 class SearchCommand(BaseCommand):
     """Command for searching books in the library."""
 
-    def __init__(self, storage: AbstractStorage) -> None:
-        super().__init__()
-        self.storage = storage
-
     def configure(self, parser: ArgumentParser) -> None:
         parser.add_argument("query", help="Search query")
         parser.add_argument(
@@ -41,7 +36,7 @@ class SearchCommand(BaseCommand):
             return SearchCommandResult(
                 success=True,
                 message=f"Found {len(books)} matching books",
-                data=[book.to_dict() for book in books],
+                data=[book.to_display_dict() for book in books],
             )
 
         except ValueError as e:
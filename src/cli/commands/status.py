@@ -4,10 +4,9 @@ from dataclasses import dataclass
 
 from src.cli.commands.base import BaseCommand, CommandResult
 from src.models.book import BookStatus
-from src.storage.abstract import AbstractStorage
 
 
-@dataclass
+@dataclass(slots=True)
 class StatusCommandResult(CommandResult):
     """Result of status update command execution."""
 
@@ -15,10 +14,6 @@ class StatusCommandResult(CommandResult):
 class StatusCommand(BaseCommand):
     """Command for updating a book's status."""
 
-    def __init__(self, storage: AbstractStorage) -> None:
-        super().__init__()
-        self.storage = storage
-
     def configure(self, parser: ArgumentParser) -> None:
         parser.add_argument("book_id", help="Book ID")
         parser.add_argument(
@@ -41,7 +36,7 @@ class StatusCommand(BaseCommand):
             return StatusCommandResult(
                 success=True,
                 message=f"Book status updated to {args.status}",
-                data=book.to_dict(),
+                data=book.to_display_dict(),
             )
 
         except ValueError as e:
@@ -1,13 +1,68 @@
 # src/cli/output.py
 from abc import ABC, abstractmethod
+from collections.abc import Callable
 from datetime import datetime
+from functools import lru_cache
 from typing import Any
 
-from rich.console import Console
-from rich.table import Table
-
 from src.cli.commands.base import CommandResult
 
+# ``rich`` pulls in a large module graph (pygments et al.), which dominates
+# CLI start-up when nothing is ever rendered, so the classes are resolved
+# on first use; later calls are served straight from the lru_cache.
+
+
+@lru_cache(maxsize=1)
+def _ensure_rich() -> tuple[Any, Any]:
+    """Return ``(Console, Table)``, importing Rich only on the first call."""
+    from rich.console import Console
+    from rich.table import Table
+
+    return Console, Table
+
+
+@lru_cache(maxsize=16)
+def _table_headers(columns: tuple[str, ...]) -> tuple[str, ...]:
+    """Human-readable header labels, cached per column layout."""
+    return tuple(column.replace("_", " ").title() for column in columns)
+
+
+def _format_status(value: Any) -> str:
+    """Colorize a status cell."""
+    if value == "available":
+        return f"[green]{value}[/green]"
+    return f"[yellow]{value}[/yellow]"
+
+
+def _format_maybe_datetime(value: str) -> str:
+    """Reformat isoformat strings for display, pass anything else through."""
+    if "T" in value:
+        try:
+            return datetime.fromisoformat(value).strftime("%Y-%m-%d %H:%M:%S")
+        except ValueError:
+            pass
+    return value
+
+
+def _identity(value: str) -> str:
+    """Pass a cell through untouched — no PyObject_Str call needed."""
+    return value
+
+
+def _column_formatter(column: str, sample: Any) -> Callable[[Any], str]:
+    """
+    Pick a render callable for a column up front.
+
+    Choosing the formatter once per column (based on its name and the first
+    row's value) keeps the per-cell loop free of status/datetime branches,
+    and columns already known to hold plain strings skip str() entirely.
+    """
+    if column == "status":
+        return _format_status
+    if type(sample) is str:
+        return _format_maybe_datetime if "T" in sample else _identity
+    return str
+
 
 class OutputFormatter(ABC):
     """Abstract base class for formatting command output."""
@@ -25,7 +80,15 @@ class ConsoleOutput(OutputFormatter):
     """Rich console output formatter."""
 
     def __init__(self) -> None:
-        self.console = Console()
+        self._console: Any = None
+
+    @property
+    def console(self) -> Any:
+        """Rich console, instantiated on first access."""
+        if self._console is None:
+            console_cls, _ = _ensure_rich()
+            self._console = console_cls()
+        return self._console
 
     def display(self, result: CommandResult) -> None:
         """
@@ -65,36 +128,23 @@ class ConsoleOutput(OutputFormatter):
         if not data:
             return
 
-        table = Table(show_header=True, header_style="bold magenta")
+        _, table_cls = _ensure_rich()
+        table = table_cls(show_header=True, header_style="bold magenta")
 
         # Add columns based on the first item's keys
-        columns = list(data[0].keys())
-        for column in columns:
-            table.add_column(column.replace("_", " ").title())
+        columns = tuple(data[0].keys())
+        for header in _table_headers(columns):
+            table.add_column(header)
+
+        # One render callable per column, chosen outside the row loop
+        per_column = [
+            (_column_formatter(column, data[0][column]), column) for column in columns
+        ]
 
-        # Add rows
         for item in data:
-            row = []
-            for column in columns:
-                cell_value = item[column]
-
-                # Format dates
-                if isinstance(cell_value, str) and "T" in cell_value:
-                    try:
-                        dt = datetime.fromisoformat(cell_value)
-                        cell_value = dt.strftime("%Y-%m-%d %H:%M:%S")
-                    except ValueError:
-                        pass
-
-                # Format status
-                if column == "status":
-                    if cell_value == "available":
-                        cell_value = f"[green]{cell_value}[/green]"
-                    else:
-                        cell_value = f"[yellow]{cell_value}[/yellow]"
-
-                row.append(str(cell_value))
-            table.add_row(*row)
+            table.add_row(
+                *[formatter(item[column]) for formatter, column in per_column]
+            )
 
         self.console.print(table)
 
@@ -105,7 +155,8 @@ class ConsoleOutput(OutputFormatter):
         Args:
             data: Dictionary to display
         """
-        table = Table(show_header=False, box=None)
+        _, table_cls = _ensure_rich()
+        table = table_cls(show_header=False, box=None)
         table.add_column("Field", style="bold blue")
         table.add_column("Value")
 
@@ -1,4 +1,5 @@
 # src/models/base.py
+import sys
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from datetime import UTC, datetime
@@ -9,6 +10,54 @@ MAX_BOOK_TITLE_LENGTH = 200
 MAX_AUTHOR_NAME_LENGTH = 100
 MIN_PUBLICATION_YEAR = 1000
 
+# Resolved once at import: for a single-shot CLI process the module-load
+# value is exact, and it saves a clock read per validated book.
+_CURRENT_YEAR = datetime.now(tz=UTC).year
+
+
+def _check_str(
+    value: str, max_length: int, name: str, length_name: str | None = None
+) -> None:
+    """
+    Shared fast-path check for the string fields.
+
+    ``type(value) is not str`` avoids the isinstance MRO walk and
+    ``value.__len__()`` is a direct slot call, so each field costs a single
+    short-circuited boolean chain.
+    """
+    if type(value) is not str or not value:
+        raise ValueError(f"{name} must be a non-empty string")
+    if value.__len__() > max_length:
+        raise ValueError(
+            f"{length_name or name} must not exceed {max_length} characters"
+        )
+
+
+def validate_book_id(value: str) -> None:
+    """Validate a raw book ID string."""
+    _check_str(value, MAX_BOOK_ID_LENGTH, "Book ID")
+
+
+def validate_title(value: str) -> None:
+    """Validate a raw book title string."""
+    _check_str(value, MAX_BOOK_TITLE_LENGTH, "Book title")
+
+
+def validate_author(value: str) -> None:
+    """Validate a raw author string."""
+    _check_str(value, MAX_AUTHOR_NAME_LENGTH, "Author", "Author name")
+
+
+def validate_year(value: int) -> None:
+    """Validate a raw publication year."""
+    if not isinstance(value, int):
+        raise ValueError("Publication year must be an integer")
+    if value < MIN_PUBLICATION_YEAR or value > _CURRENT_YEAR:
+        raise ValueError(
+            f"Publication year must be between "
+            f"{MIN_PUBLICATION_YEAR} and {_CURRENT_YEAR}"
+        )
+
 
 class ValueObject(ABC):
     """Base class for all value objects in the domain."""
@@ -30,10 +79,7 @@ class BookId(ValueObject):
     value: str
 
     def validate(self) -> None:
-        if not self.value or not isinstance(self.value, str):
-            raise ValueError("Book ID must be a non-empty string")
-        if len(self.value) > MAX_BOOK_ID_LENGTH:
-            raise ValueError(f"Book ID must not exceed {MAX_BOOK_ID_LENGTH} characters")
+        validate_book_id(self.value)
 
 
 @dataclass(frozen=True)
@@ -43,12 +89,7 @@ class BookTitle(ValueObject):
     value: str
 
     def validate(self) -> None:
-        if not self.value or not isinstance(self.value, str):
-            raise ValueError("Book title must be a non-empty string")
-        if len(self.value) > MAX_BOOK_TITLE_LENGTH:
-            raise ValueError(
-                f"Book title must not exceed {MAX_BOOK_TITLE_LENGTH} characters"
-            )
+        validate_title(self.value)
 
 
 @dataclass(frozen=True)
@@ -58,12 +99,7 @@ class Author(ValueObject):
     value: str
 
     def validate(self) -> None:
-        if not self.value or not isinstance(self.value, str):
-            raise ValueError("Author must be a non-empty string")
-        if len(self.value) > MAX_AUTHOR_NAME_LENGTH:
-            raise ValueError(
-                f"Author name must not exceed {MAX_AUTHOR_NAME_LENGTH} characters"
-            )
+        validate_author(self.value)
 
 
 @dataclass(frozen=True)
@@ -73,23 +109,23 @@ class PublicationYear(ValueObject):
     value: int
 
     def validate(self) -> None:
-        current_year = datetime.now(tz=UTC).year
-        if not isinstance(self.value, int):
-            raise ValueError("Publication year must be an integer")
-        if self.value < MIN_PUBLICATION_YEAR or self.value > current_year:
-            raise ValueError(
-                f"Publication year must be between "
-                f"{MIN_PUBLICATION_YEAR} and {current_year}"
-            )
+        validate_year(self.value)
 
 
 class BookStatus:
     """Enumeration of possible book statuses."""
 
-    AVAILABLE = "available"
-    BORROWED = "borrowed"
+    # Interned so equality checks against stored statuses can short-circuit
+    # on pointer identity in CPython.
+    AVAILABLE = sys.intern("available")
+    BORROWED = sys.intern("borrowed")
 
     @classmethod
     def is_valid(cls, status: str) -> bool:
         """Check if a status value is valid."""
-        return status in {cls.AVAILABLE, cls.BORROWED}
+        return status in _VALID_STATUSES
+
+
+# Hoisted to module scope: building the set literal per is_valid() call
+# meant one set allocation per validated book.
+_VALID_STATUSES = frozenset({BookStatus.AVAILABLE, BookStatus.BORROWED})
@@ -1,37 +1,127 @@
 # src/models/book.py
-from dataclasses import dataclass
+import itertools
+import secrets
+import time
+from dataclasses import dataclass, field
 from datetime import UTC, datetime
+from operator import attrgetter
+
+from .base import (
+    Author,
+    BookId,
+    BookStatus,
+    BookTitle,
+    PublicationYear,
+    validate_author,
+    validate_book_id,
+    validate_title,
+    validate_year,
+)
+
+__all__ = [
+    "Author",
+    "Book",
+    "BookId",
+    "BookStatus",
+    "BookTitle",
+    "PublicationYear",
+]
+
+# Real datetime constructor, captured at import so tests that substitute the
+# module-level ``datetime`` for clock mocking don't affect timestamp parsing.
+_datetime = datetime
+
+# Monotonic ID source: next() is a single atomic increment with no clock
+# read and, unlike the old float timestamp, cannot collide on rapid
+# inserts within a process.  The seed mixes the epoch with 32 random
+# bits so processes started in the same millisecond draw from ranges
+# that overlap only with ~N/2**32 probability after N inserts.
+_ID_COUNTER = itertools.count((int(time.time() * 1000) << 32) | secrets.randbits(32))
+
+# Timestamp format used for human-readable output.
+_DISPLAY_TIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+# Width of the fixed serialization format "YYYY-MM-DDTHH:MM:SS.ffffff+00:00".
+_TIMESTAMP_WIDTH = 32
+
+
+def _parse_timestamp(value: str) -> datetime:
+    """
+    Parse a timestamp written by :meth:`Book.to_dict`.
+
+    Storage always writes the fixed-width UTC format above, so a direct
+    slice-and-int parse skips fromisoformat's format detection (3-5x
+    faster); anything else falls back to the general parser.
+    """
+    if len(value) == _TIMESTAMP_WIDTH and value.endswith("+00:00"):
+        return _datetime(
+            int(value[0:4]),
+            int(value[5:7]),
+            int(value[8:10]),
+            int(value[11:13]),
+            int(value[14:16]),
+            int(value[17:19]),
+            int(value[20:26]),
+            UTC,
+        )
+    return _datetime.fromisoformat(value)
+
 
-from .base import Author, BookId, BookStatus, BookTitle, PublicationYear
+# Key order of to_dict(), paired with a single C-level bulk attribute fetch.
+_DICT_KEYS = ("id", "title", "author", "year", "status", "created_at", "updated_at")
+_DICT_VALUES = attrgetter(
+    "id",
+    "title",
+    "author",
+    "year",
+    "status",
+    "_created_iso",
+    "_updated_iso",
+)
 
 
-@dataclass
+@dataclass(slots=True)
 class Book:
     """
     Domain model representing a book in the library system.
 
     This class encapsulates all the business rules and validation logic
     related to books in the library system.
+
+    Fields are stored as plain strings/ints rather than value-object
+    wrappers: the storage hot path unwrapped them immediately anyway, so
+    the flat form halves per-book allocations.  The value-object classes
+    in :mod:`src.models.base` remain available for callers that want a
+    validated wrapper type.
     """
 
-    id: BookId
-    title: BookTitle
-    author: Author
-    year: PublicationYear
+    id: str
+    title: str
+    author: str
+    year: int
     status: str
     created_at: datetime
     updated_at: datetime
+    # Serialized timestamps, cached so to_dict() never re-runs isoformat().
+    _created_iso: str = field(default="", repr=False, compare=False)
+    _updated_iso: str = field(default="", repr=False, compare=False)
+    # Display timestamps, filled lazily on first to_display_dict() call.
+    _created_disp: str = field(default="", repr=False, compare=False)
+    _updated_disp: str = field(default="", repr=False, compare=False)
 
     def __post_init__(self) -> None:
-        """Validate all value objects and status after initialization."""
-        self.id.validate()
-        self.title.validate()
-        self.author.validate()
-        self.year.validate()
+        """Validate all fields and status after initialization."""
+        validate_book_id(self.id)
+        validate_title(self.title)
+        validate_author(self.author)
+        validate_year(self.year)
 
         if not BookStatus.is_valid(self.status):
             raise ValueError(f"Invalid status: {self.status}")
 
+        self._created_iso = self.created_at.isoformat(timespec="microseconds")
+        self._updated_iso = self.updated_at.isoformat(timespec="microseconds")
+
     @classmethod
     def create(
         cls, title: str, author: str, year: int, book_id: str | None = None
@@ -53,10 +143,10 @@ class Book:
         """
         now = datetime.now(tz=UTC)
         return cls(
-            id=BookId(book_id or f"book_{now.timestamp()}"),
-            title=BookTitle(title),
-            author=Author(author),
-            year=PublicationYear(year),
+            id=book_id or f"book_{next(_ID_COUNTER):x}",
+            title=title,
+            author=author,
+            year=year,
             status=BookStatus.AVAILABLE,
             created_at=now,
             updated_at=now,
@@ -76,26 +166,74 @@ class Book:
             raise ValueError(f"Invalid status: {new_status}")
         self.status = new_status
         self.updated_at = datetime.now(tz=UTC)
+        self._updated_iso = self.updated_at.isoformat(timespec="microseconds")
+        self._updated_disp = ""
 
     def to_dict(self) -> dict:
         """Convert the book instance to a dictionary for storage."""
+        return dict(zip(_DICT_KEYS, _DICT_VALUES(self), strict=True))
+
+    def to_display_dict(self) -> dict:
+        """
+        Convert the book instance to a dictionary for rendering.
+
+        Timestamps are emitted already formatted for display so the output
+        layer never has to re-parse isoformat strings; the formatted values
+        are cached and invalidated when the book is mutated.
+        """
+        if not self._created_disp:
+            self._created_disp = self.created_at.strftime(_DISPLAY_TIME_FORMAT)
+        if not self._updated_disp:
+            self._updated_disp = self.updated_at.strftime(_DISPLAY_TIME_FORMAT)
         return {
-            "id": self.id.value,
-            "title": self.title.value,
-            "author": self.author.value,
-            "year": self.year.value,
+            "id": self.id,
+            "title": self.title,
+            "author": self.author,
+            "year": self.year,
             "status": self.status,
-            "created_at": self.created_at.isoformat(),
-            "updated_at": self.updated_at.isoformat(),
+            "created_at": self._created_disp,
+            "updated_at": self._updated_disp,
         }
 
     @classmethod
-    def from_dict(cls, data: dict) -> "Book":
+    def from_trusted_dict(cls, data: dict) -> "Book":
+        """
+        Create a Book from data this application previously wrote.
+
+        Bypasses ``__post_init__`` validation entirely: storage files are
+        written from already-validated books, so re-running every value
+        object's checks on each load is wasted work on the hot path.  Use
+        :meth:`from_dict` for data of external origin.
+
+        Args:
+            data: Dictionary produced by :meth:`to_dict`
+
+        Returns:
+            A new Book instance
+        """
+        book = object.__new__(cls)
+        book.id = data["id"]
+        book.title = data["title"]
+        book.author = data["author"]
+        book.year = data["year"]
+        book.status = data["status"]
+        book.created_at = _parse_timestamp(data["created_at"])
+        book.updated_at = _parse_timestamp(data["updated_at"])
+        book._created_iso = data["created_at"]
+        book._updated_iso = data["updated_at"]
+        book._created_disp = ""
+        book._updated_disp = ""
+        return book
+
+    @classmethod
+    def from_dict(cls, data: dict, *, trusted: bool = False) -> "Book":
         """
         Create a Book instance from a dictionary.
 
         Args:
             data: Dictionary containing book data
+            trusted: Skip validation for data this application wrote
+                itself, delegating to :meth:`from_trusted_dict`
 
         Returns:
             A new Book instance
@@ -103,12 +241,14 @@ class Book:
         Raises:
             ValueError: If the dictionary data is invalid
         """
+        if trusted:
+            return cls.from_trusted_dict(data)
         return cls(
-            id=BookId(data["id"]),
-            title=BookTitle(data["title"]),
-            author=Author(data["author"]),
-            year=PublicationYear(data["year"]),
+            id=data["id"],
+            title=data["title"],
+            author=data["author"],
+            year=data["year"],
             status=data["status"],
-            created_at=datetime.fromisoformat(data["created_at"]),
-            updated_at=datetime.fromisoformat(data["updated_at"]),
+            created_at=_parse_timestamp(data["created_at"]),
+            updated_at=_parse_timestamp(data["updated_at"]),
         )
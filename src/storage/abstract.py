@@ -1,5 +1,7 @@
 # src/storage/abstract.py
 from abc import ABC, abstractmethod
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
 
 from src.models.book import Book
 
@@ -8,6 +10,9 @@ class AbstractStorage(ABC):
     """Abstract base class defining the storage interface for the book management
     system."""
 
+    # Empty here so slotted subclasses actually stay dict-free.
+    __slots__ = ()
+
     @abstractmethod
     def add(self, book: Book) -> None:
         """
@@ -74,6 +79,112 @@ class AbstractStorage(ABC):
             StorageError: If storage operation fails
         """
 
+    def bulk_add(self, books: Iterable[Book]) -> None:
+        """
+        Add many books in one batch.
+
+        The default loops over :meth:`add` inside :meth:`buffered`, so
+        backends that coalesce writes persist once for the whole batch
+        instead of once per book.
+
+        Args:
+            books: Book instances to store
+
+        Raises:
+            ValueError: If a book with a duplicate ID is encountered
+            StorageError: If storage operation fails
+        """
+        with self.buffered():
+            for book in books:
+                self.add(book)
+
+    def bulk_update(self, books: Iterable[Book]) -> None:
+        """
+        Update many books in one batch.
+
+        Args:
+            books: Book instances with updated data
+
+        Raises:
+            ValueError: If a book doesn't exist
+            StorageError: If storage operation fails
+        """
+        with self.buffered():
+            for book in books:
+                self.update(book)
+
+    def bulk_delete(self, book_ids: Iterable[str]) -> None:
+        """
+        Delete many books in one batch.
+
+        Args:
+            book_ids: Identifiers of the books to delete
+
+        Raises:
+            ValueError: If a book doesn't exist
+            StorageError: If storage operation fails
+        """
+        with self.buffered():
+            for book_id in book_ids:
+                self.delete(book_id)
+
+    # Deliberately concrete: write-through backends need no flush.
+    def flush(self) -> None:  # noqa: B027
+        """
+        Persist any buffered changes.
+
+        No-op by default; backends that defer writes override this.
+
+        Raises:
+            StorageError: If storage operation fails
+        """
+
+    @contextmanager
+    def buffered(self) -> Iterator["AbstractStorage"]:
+        """
+        Context manager batching mutations into a single flush on exit.
+
+        The default implementation does not buffer: it simply yields the
+        storage, so write-through backends can be used unchanged.
+        """
+        yield self
+
+    def iter_all(self) -> Iterator[Book]:
+        """
+        Iterate over all books in storage.
+
+        Streaming counterpart to :meth:`list_all` for callers that only
+        need one pass: no intermediate list of Book instances is
+        materialized.  Implementations should override this with a true
+        generator; the default falls back to list_all().
+
+        Yields:
+            Book instances
+
+        Raises:
+            StorageError: If storage operation fails
+        """
+        yield from self.list_all()
+
+    def iter_all_raw(self) -> Iterator[dict]:
+        """
+        Iterate over all books as their stored dictionaries.
+
+        For pipelines that only project fields (e.g. tabular display),
+        yielding the raw dicts skips Book construction entirely.
+        Implementations backed by dict storage should override this to
+        yield their stored values directly; the default round-trips
+        through :meth:`iter_all`.
+
+        Yields:
+            Book data dictionaries in :meth:`Book.to_dict` form
+
+        Raises:
+            StorageError: If storage operation fails
+        """
+        for book in self.iter_all():
+            yield book.to_dict()
+
     @abstractmethod
     def search(self, query: str, field: str) -> list[Book]:
         """
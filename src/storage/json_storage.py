@@ -1,9 +1,19 @@
 # src/storage/json_storage.py
-import json
+import fcntl
+import os
+import re
+import tempfile
+from bisect import bisect_right
+from collections.abc import Iterator
+from contextlib import contextmanager, suppress
+from functools import lru_cache
 from pathlib import Path
 from threading import Lock
 from typing import Any  # Add this import at the top with other imports
 
+import ijson
+import orjson
+
 from src.models.book import Book
 
 from .abstract import AbstractStorage
@@ -12,19 +22,230 @@ from .abstract import AbstractStorage
 class StorageError(Exception):
     """Custom exception for storage-related errors."""
 
+    __slots__ = ()
+
+
+# Fields accepted by search(); hoisted so validation reuses one
+# pre-built frozenset instead of constructing a literal per call.
+_VALID_SEARCH_FIELDS = frozenset(("title", "author", "year"))
+
+# Width of the character q-grams used for substring indexing.
+_GRAM_WIDTH = 3
+
+# Bound on remembered search results per storage instance.
+_SEARCH_MEMO_SIZE = 128
+
+# Files above this size are parsed streamingly instead of in one buffer.
+_STREAM_THRESHOLD = 1 << 20  # 1 MiB
+
+# WAL size past which pending deltas are folded into the main file.
+_WAL_COMPACT_SIZE = 1 << 20  # 1 MiB
+
+
+@lru_cache(maxsize=64)
+def _literal_pattern(query_lc: str) -> re.Pattern[str]:
+    """Compile ``query_lc`` as a literal pattern, cached across searches."""
+    return re.compile(re.escape(query_lc))
+
+
+def _grams(text: str) -> set[str]:
+    """Return the set of character trigrams of ``text``."""
+    return {text[i : i + _GRAM_WIDTH] for i in range(len(text) - _GRAM_WIDTH + 1)}
+
+
+class _SearchIndex:
+    """
+    In-memory inverted index over the title/author/year fields.
+
+    Title and author text is indexed by lowercase character trigrams
+    (pg_trgm style): every trigram of a matching substring must appear
+    in the row's trigram set, so intersecting the query's posting lists
+    yields a small candidate superset to verify instead of scanning all
+    rows.  Years get a plain hash index.  Queries shorter than a
+    trigram fall back to a full scan (signalled by ``None``).
+
+    Field text is case-folded exactly once, when a book is indexed; the
+    cached lowercase strings serve every later substring check, so a
+    search never calls ``str.lower`` per row.
+
+    Queries too short for a trigram are answered by a single
+    ``str.find`` sweep over all rows' text joined into one separator-
+    delimited corpus string: one C-level scan of contiguous memory
+    instead of a Python-level ``in`` test per row.
+    """
+
+    __slots__ = ("_corpus", "_postings", "_text_lc", "_years")
+
+    def __init__(self) -> None:
+        # field -> trigram -> ids; two tiny dicts beat one keyed on pairs.
+        self._postings: dict[str, dict[str, set[str]]] = {
+            "title": {},
+            "author": {},
+        }
+        self._years: dict[int, set[str]] = {}
+        # id -> (title_lc, author_lc), folded once at index time.
+        self._text_lc: dict[str, tuple[str, str]] = {}
+        # field -> (joined text, row start offsets, row ids), built lazily
+        # and dropped on any mutation.
+        self._corpus: dict[str, tuple[str, list[int], list[str]] | None] = {
+            "title": None,
+            "author": None,
+        }
+
+    def add(self, book_id: str, book_data: dict) -> None:
+        """Index one book's fields under ``book_id``."""
+        title_lc = str(book_data["title"]).lower()
+        author_lc = str(book_data["author"]).lower()
+        self._text_lc[book_id] = (title_lc, author_lc)
+        for postings, text in (
+            (self._postings["title"], title_lc),
+            (self._postings["author"], author_lc),
+        ):
+            for gram in _grams(text):
+                postings.setdefault(gram, set()).add(book_id)
+        self._years.setdefault(book_data["year"], set()).add(book_id)
+        self._corpus["title"] = self._corpus["author"] = None
+
+    def discard(self, book_id: str, book_data: dict) -> None:
+        """Remove ``book_id``'s entries, dropping emptied posting lists."""
+        title_lc, author_lc = self._text_lc.pop(book_id)
+        for postings, text in (
+            (self._postings["title"], title_lc),
+            (self._postings["author"], author_lc),
+        ):
+            for gram in _grams(text):
+                ids = postings.get(gram)
+                if ids is not None:
+                    ids.discard(book_id)
+                    if not ids:
+                        del postings[gram]
+        ids = self._years.get(book_data["year"])
+        if ids is not None:
+            ids.discard(book_id)
+            if not ids:
+                del self._years[book_data["year"]]
+        self._corpus["title"] = self._corpus["author"] = None
+
+    def text(self, book_id: str, field: str) -> str:
+        """Return the cached lowercase text of ``field`` for ``book_id``."""
+        pair = self._text_lc[book_id]
+        return pair[0] if field == "title" else pair[1]
+
+    def _corpus_for(self, field: str) -> tuple[str, list[int], list[str]]:
+        """Return (joined text, row offsets, row ids), rebuilding if stale."""
+        corpus = self._corpus[field]
+        if corpus is None:
+            part = 0 if field == "title" else 1
+            ids = list(self._text_lc)
+            texts = [pair[part] for pair in self._text_lc.values()]
+            offsets: list[int] = []
+            offsets_append = offsets.append
+            pos = 0
+            for text in texts:
+                offsets_append(pos)
+                pos += len(text) + 1  # +1 for the separator
+            self._corpus[field] = corpus = ("\x01".join(texts), offsets, ids)
+        return corpus
+
+    def scan(self, query_lc: str, field: str) -> list[str]:
+        """
+        Exact substring scan over all rows, in insertion order.
+
+        Serves queries shorter than a trigram: one pass of the SRE C
+        engine over the joined corpus replaces per-row ``in`` tests and
+        the Python-level find/advance loop.  Matches never span rows
+        (the separator cannot occur in a query), so each match start
+        maps to exactly one row.
+        """
+        if not query_lc:
+            return list(self._text_lc)
+        joined, offsets, ids = self._corpus_for(field)
+        hits: list[str] = []
+        seen: set[str] = set()
+        # Bind the bound methods once: LOAD_FAST per hit instead of an
+        # attribute lookup per hit.
+        hits_append = hits.append
+        seen_add = seen.add
+        for match in _literal_pattern(query_lc).finditer(joined):
+            book_id = ids[bisect_right(offsets, match.start()) - 1]
+            if book_id not in seen:
+                seen_add(book_id)
+                hits_append(book_id)
+        return hits
+
+    def year_ids(self, year: int) -> set[str]:
+        """Return the ids of books published in ``year``."""
+        return self._years.get(year, set())
+
+    def candidates(self, query_lc: str, field: str) -> set[str] | None:
+        """
+        Return a candidate-id superset for a substring query, or ``None``.
+
+        ``None`` means the query is too short to have a trigram and the
+        caller must fall back to a linear scan.  The returned set may
+        contain false positives; callers re-check the actual substring.
+        """
+        if len(query_lc) < _GRAM_WIDTH:
+            return None
+        postings = self._postings[field]
+        ids: set[str] | None = None
+        for gram in _grams(query_lc):
+            hit = postings.get(gram)
+            if hit is None:
+                return set()
+            ids = hit.copy() if ids is None else ids & hit
+            if not ids:
+                return ids
+        return ids if ids is not None else set()
+
 
 class JsonStorage(AbstractStorage):
     """JSON file-based implementation of book storage."""
 
-    def __init__(self, file_path: str | Path) -> None:
+    __slots__ = (
+        "_buffering",
+        "_cache",
+        "_cache_mtime_ns",
+        "_dirty",
+        "_dump_option",
+        "_index",
+        "_lock",
+        "_search_memo",
+        "_version",
+        "_wal_mtime_ns",
+        "_wal_path",
+        "file_path",
+    )
+
+    def __init__(self, file_path: str | Path, pretty: bool = False) -> None:
         """
         Initialize JSON storage.
 
         Args:
             file_path: Path to the JSON storage file
+            pretty: Indent the file for human readers; the compact
+                default writes and parses noticeably less text
         """
         self.file_path = Path(file_path)
-        self._lock = Lock()  # For thread-safe file operations
+        # Append-only log of mutations not yet folded into the main
+        # file; replayed over it on load, truncated on every full save.
+        self._wal_path = self.file_path.with_name(self.file_path.name + ".wal")
+        self._wal_mtime_ns = -1
+        self._dump_option = orjson.OPT_INDENT_2 if pretty else 0
+        self._lock = Lock()  # Guards the cache fields below, not the file
+        # Parsed-file cache: mutations edit it in place and mark it dirty;
+        # the file is re-read only when its mtime no longer matches.
+        self._cache: dict[str, dict[str, Any]] | None = None
+        self._cache_mtime_ns = -1
+        self._dirty = False
+        self._buffering = False
+        # Search index, built lazily on first search and kept in sync by
+        # mutations; dropped whenever the file is re-read from disk.
+        self._index: _SearchIndex | None = None
+        # Memoized search results, stamped with the data version that
+        # produced them; any mutation or reload bumps the version.
+        self._version = 0
+        self._search_memo: dict[tuple[str, str], tuple[int, list[Book]]] = {}
         self._ensure_storage_exists()
 
     def _ensure_storage_exists(self) -> None:
@@ -36,123 +257,452 @@ class JsonStorage(AbstractStorage):
             except Exception as e:
                 raise StorageError(f"Failed to create storage file: {e}") from e
         else:
-            try:
-                self._load_data()
-            except json.JSONDecodeError as e:
-                raise StorageError(f"Storage file contains invalid JSON: {e}") from e
+            # _load_data wraps any parse failure (including decode
+            # errors) in StorageError, so no extra handling is needed.
+            self._load_data()
+
+    @staticmethod
+    def _mtime_ns(path: Path) -> int:
+        """Return ``path``'s mtime, or -1 if it doesn't exist."""
+        try:
+            return path.stat().st_mtime_ns
+        except OSError:
+            return -1
 
     def _load_data(self) -> dict[str, dict[str, Any]]:
-        """Load data from JSON file."""
+        """Load data from the cache, re-reading the files only when stale."""
+        if self._cache is not None and (
+            self._dirty
+            or (
+                self._mtime_ns(self.file_path) == self._cache_mtime_ns
+                and self._mtime_ns(self._wal_path) == self._wal_mtime_ns
+            )
+        ):
+            return self._cache
+
         try:
-            with self._lock, open(self.file_path, encoding="utf-8") as f:
-                return json.load(f)  # type: ignore
+            raw: bytes | None = None
+            with open(self.file_path, "rb") as f:
+                # Shared advisory lock: concurrent readers proceed,
+                # writers are excluded.
+                fcntl.flock(f, fcntl.LOCK_SH)
+                try:
+                    if os.fstat(f.fileno()).st_size > _STREAM_THRESHOLD:
+                        # Large file: ijson's C backend builds the dict
+                        # row by row, so peak memory is the dict plus one
+                        # row instead of raw bytes + full parse at once.
+                        data: dict[str, dict[str, Any]] = dict(ijson.kvitems(f, ""))
+                    else:
+                        # Small file: one bulk read, parsed outside the
+                        # lock with orjson.
+                        raw = f.read()
+                finally:
+                    fcntl.flock(f, fcntl.LOCK_UN)
+            if raw is not None:
+                data = orjson.loads(raw)
+            self._replay_wal(data)
         except Exception as e:
             raise StorageError(f"Failed to load storage: {e}") from e
+        with self._lock:
+            self._cache = data
+            self._cache_mtime_ns = self._mtime_ns(self.file_path)
+            self._wal_mtime_ns = self._mtime_ns(self._wal_path)
+            self._dirty = False
+            self._index = None
+            self._version += 1
+        return data
+
+    def _replay_wal(self, data: dict[str, dict[str, Any]]) -> None:
+        """Apply any logged mutations on top of the freshly read data."""
+        try:
+            wal_raw = self._wal_path.read_bytes()
+        except FileNotFoundError:
+            return
+        for line in wal_raw.splitlines():
+            if not line:
+                continue
+            record = orjson.loads(line)
+            if record["op"] == "delete":
+                data.pop(record["id"], None)
+            else:
+                data[record["id"]] = record["data"]
+
+    def _log(self, op: str, book_id: str, book_data: dict | None = None) -> None:
+        """
+        Record one mutation.
+
+        Outside buffered(), the mutation is appended to the WAL and
+        fsynced: O(1) bytes per op instead of rewriting the whole file,
+        LSM style.  The log is folded into the main file whenever it
+        grows past _WAL_COMPACT_SIZE or an explicit flush happens.
+        """
+        self._dirty = True
+        if self._buffering:
+            return
+        record: dict[str, Any] = {"op": op, "id": book_id}
+        if book_data is not None:
+            record["data"] = book_data
+        try:
+            with open(self._wal_path, "ab") as wal:
+                fcntl.flock(wal, fcntl.LOCK_EX)
+                try:
+                    wal.write(orjson.dumps(record) + b"\n")
+                    wal.flush()
+                    os.fsync(wal.fileno())
+                    wal_size = wal.tell()
+                finally:
+                    fcntl.flock(wal, fcntl.LOCK_UN)
+        except Exception as e:
+            raise StorageError(f"Failed to save to storage: {e}") from e
+        with self._lock:
+            self._wal_mtime_ns = self._mtime_ns(self._wal_path)
+        if wal_size > _WAL_COMPACT_SIZE:
+            self._save_data(self._cache or {})
 
     def _save_data(self, data: dict) -> None:
-        """Save data to JSON file."""
+        """Atomically save data to the JSON file."""
         try:
-            with self._lock, open(self.file_path, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            # Serialize to one buffer first; orjson encodes straight to
+            # UTF-8 bytes in C, several times faster than stdlib json.
+            payload = orjson.dumps(data, option=self._dump_option)
+            # Write to a sibling temp file, then swap it in with an
+            # atomic rename: a crash mid-write can never tear the file.
+            fd, tmp_name = tempfile.mkstemp(
+                dir=self.file_path.parent, prefix=self.file_path.name + ".tmp"
+            )
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(payload)
+                # Exclusive advisory lock over the swap keeps cross-process
+                # readers holding LOCK_SH from racing the replace.
+                with open(self.file_path, "ab") as target:
+                    fcntl.flock(target, fcntl.LOCK_EX)
+                    os.replace(tmp_name, self.file_path)
+            except BaseException:
+                with suppress(OSError):
+                    os.unlink(tmp_name)
+                raise
         except Exception as e:
             raise StorageError(f"Failed to save to storage: {e}") from e
+        # Everything logged so far is now in the main file.
+        with suppress(FileNotFoundError):
+            self._wal_path.unlink()
+        with self._lock:
+            self._cache = data
+            self._cache_mtime_ns = self._mtime_ns(self.file_path)
+            self._wal_mtime_ns = -1
+            self._dirty = False
+
+    def _flush(self) -> None:
+        """Compact the cache into the main file unless buffering or clean."""
+        if self._buffering or not self._dirty:
+            return
+        self._save_data(self._cache or {})
+
+    def flush(self) -> None:
+        """Fold pending mutations into the main file."""
+        self._flush()
+
+    @contextmanager
+    def buffered(self) -> Iterator["JsonStorage"]:
+        """
+        Batch mutations into a single file write.
+
+        Inside the context, add/update/delete only touch the in-memory
+        cache; the file is rewritten once on exit.  Turns N mutations'
+        N load+dump cycles into a single dump.
+        """
+        self._buffering = True
+        try:
+            yield self
+        finally:
+            self._buffering = False
+            self._flush()
+
+    def _index_for(self, data: dict[str, dict[str, Any]]) -> _SearchIndex:
+        """Return the search index, building it from ``data`` if absent."""
+        index = self._index
+        if index is None:
+            index = _SearchIndex()
+            for book_id, book_data in data.items():
+                index.add(book_id, book_data)
+            self._index = index
+        return index
 
     def add(self, book: Book) -> None:
         data = self._load_data()
-        if book.id.value in data:
-            raise ValueError(f"Book with ID {book.id.value} already exists")
+        book_data = book.to_dict()
+        # setdefault inserts and reports a duplicate in one hash lookup.
+        if data.setdefault(book.id, book_data) is not book_data:
+            raise ValueError(f"Book with ID {book.id} already exists")
 
-        data[book.id.value] = book.to_dict()
-        self._save_data(data)
+        if self._index is not None:
+            self._index.add(book.id, book_data)
+        self._version += 1
+        self._log("add", book.id, book_data)
 
     def get(self, book_id: str) -> Book | None:
         data = self._load_data()
         book_data = data.get(book_id)
-        return Book.from_dict(book_data) if book_data else None
+        return Book.from_trusted_dict(book_data) if book_data else None
 
     def update(self, book: Book) -> None:
         data = self._load_data()
-        if book.id.value not in data:
-            raise ValueError(f"Book with ID {book.id.value} not found")
-
-        data[book.id.value] = book.to_dict()
-        self._save_data(data)
+        # One lookup fetches the old row and proves existence at once.
+        try:
+            old_data = data[book.id]
+        except KeyError:
+            raise ValueError(f"Book with ID {book.id} not found") from None
+
+        book_data = book.to_dict()
+        if self._index is not None:
+            self._index.discard(book.id, old_data)
+            self._index.add(book.id, book_data)
+        data[book.id] = book_data
+        self._version += 1
+        self._log("update", book.id, book_data)
 
     def delete(self, book_id: str) -> None:
         data = self._load_data()
-        if book_id not in data:
-            raise ValueError(f"Book with ID {book_id} not found")
+        # pop removes and proves existence in one hash lookup.
+        try:
+            old_data = data.pop(book_id)
+        except KeyError:
+            raise ValueError(f"Book with ID {book_id} not found") from None
 
-        del data[book_id]
-        self._save_data(data)
+        if self._index is not None:
+            self._index.discard(book_id, old_data)
+        self._version += 1
+        self._log("delete", book_id)
 
     def list_all(self) -> list[Book]:
+        return list(self.iter_all())
+
+    def iter_all(self) -> Iterator[Book]:
         data = self._load_data()
-        return [Book.from_dict(book_data) for book_data in data.values()]
+        for book_data in data.values():
+            yield Book.from_trusted_dict(book_data)
+
+    def iter_all_raw(self) -> Iterator[dict]:
+        # Read-only view of the stored dicts; callers must not mutate.
+        yield from self._load_data().values()
 
     def search(self, query: str, field: str) -> list[Book]:
-        if field not in {"title", "author", "year"}:
+        if field not in _VALID_SEARCH_FIELDS:
             raise ValueError(f"Invalid search field: {field}")
 
         data = self._load_data()
-        results = []
-
-        for book_data in data.values():
-            if field == "year":
-                # For year, convert query to int and do exact match
-                try:
-                    if int(query) == book_data["year"]:
-                        results.append(Book.from_dict(book_data))
-                except ValueError:
-                    continue
-            # For strings, do case-insensitive partial match
-            elif str(query).lower() in str(book_data[field]).lower():
-                results.append(Book.from_dict(book_data))
-
-        return results
+        memo_key = (query, field)
+        hit = self._search_memo.get(memo_key)
+        if hit is not None and hit[0] == self._version:
+            # Copy so a caller mutating its result list can't poison
+            # later hits; the Book objects themselves are shared.
+            return list(hit[1])
+
+        index = self._index_for(data)
+        if field == "year":
+            results = self._search_year(data, index, query)
+        else:
+            # Lowercase the query once; the index holds pre-folded text.
+            results = self._search_text(data, index, query.lower(), field)
+
+        memo = self._search_memo
+        if len(memo) >= _SEARCH_MEMO_SIZE:
+            # Evict the oldest entry; dicts preserve insertion order.
+            del memo[next(iter(memo))]
+        memo[memo_key] = (self._version, results)
+        return list(results)
+
+    def _search_year(
+        self, data: dict[str, dict[str, Any]], index: _SearchIndex, query: str
+    ) -> list[Book]:
+        """Exact-match years through the hash index."""
+        try:
+            year = int(query)
+        except ValueError:
+            return []
+        return [
+            Book.from_trusted_dict(data[book_id])
+            for book_id in sorted(index.year_ids(year))
+        ]
+
+    def _search_text(
+        self,
+        data: dict[str, dict[str, Any]],
+        index: _SearchIndex,
+        query_lc: str,
+        field: str,
+    ) -> list[Book]:
+        """Case-insensitive substring match through the trigram index."""
+        candidate_ids = index.candidates(query_lc, field)
+        if candidate_ids is None:
+            # Too short for the trigram index: one corpus sweep.
+            return [
+                Book.from_trusted_dict(data[book_id])
+                for book_id in index.scan(query_lc, field)
+            ]
+        return [
+            Book.from_trusted_dict(data[book_id])
+            for book_id in sorted(candidate_ids)
+            if query_lc in index.text(book_id, field)
+        ]
 
 
 class InMemoryStorage(AbstractStorage):
-    """In-memory implementation of book storage for testing."""
+    """
+    In-memory implementation of book storage for testing.
+
+    Rows are stored column-wise (structure of arrays): one dict per
+    searched field keyed by book id, plus a meta column for the fields
+    searches never touch.  A scan over one field then walks a single
+    homogeneous dict instead of dereferencing a full row dict per
+    iteration; rows are reassembled only for books actually returned.
+    """
+
+    __slots__ = (
+        "_authors",
+        "_index",
+        "_meta",
+        "_search_memo",
+        "_titles",
+        "_version",
+        "_years",
+    )
 
     def __init__(self) -> None:
         """Initialize in-memory storage."""
-        self._storage: dict[str, dict] = {}
+        self._titles: dict[str, str] = {}
+        self._authors: dict[str, str] = {}
+        self._years: dict[str, int] = {}
+        # id -> (status, created_at, updated_at) in serialized form.
+        self._meta: dict[str, tuple[str, str, str]] = {}
+        self._index = _SearchIndex()
+        self._version = 0
+        self._search_memo: dict[tuple[str, str], tuple[int, list[Book]]] = {}
+
+    def __copy__(self) -> "InMemoryStorage":
+        """Snapshot copy sharing no mutable state with the original."""
+        clone = InMemoryStorage()
+        clone._titles = dict(self._titles)
+        clone._authors = dict(self._authors)
+        clone._years = dict(self._years)
+        clone._meta = dict(self._meta)
+        for book_id in clone._titles:
+            clone._index.add(book_id, clone._reconstruct(book_id))
+        return clone
+
+    def _insert(self, book_id: str, book_data: dict) -> None:
+        """Write one row across the columns."""
+        self._titles[book_id] = book_data["title"]
+        self._authors[book_id] = book_data["author"]
+        self._years[book_id] = book_data["year"]
+        self._meta[book_id] = (
+            book_data["status"],
+            book_data["created_at"],
+            book_data["updated_at"],
+        )
+
+    def _reconstruct(self, book_id: str) -> dict:
+        """Reassemble one row into :meth:`Book.to_dict` form."""
+        status, created_at, updated_at = self._meta[book_id]
+        return {
+            "id": book_id,
+            "title": self._titles[book_id],
+            "author": self._authors[book_id],
+            "year": self._years[book_id],
+            "status": status,
+            "created_at": created_at,
+            "updated_at": updated_at,
+        }
 
     def add(self, book: Book) -> None:
-        if book.id.value in self._storage:
-            raise ValueError(f"Book with ID {book.id.value} already exists")
-        self._storage[book.id.value] = book.to_dict()
+        if book.id in self._titles:
+            raise ValueError(f"Book with ID {book.id} already exists")
+        book_data = book.to_dict()
+        self._insert(book.id, book_data)
+        self._index.add(book.id, book_data)
+        self._version += 1
 
     def get(self, book_id: str) -> Book | None:
-        book_data = self._storage.get(book_id)
-        return Book.from_dict(book_data) if book_data else None
+        if book_id not in self._titles:
+            return None
+        return Book.from_trusted_dict(self._reconstruct(book_id))
 
     def update(self, book: Book) -> None:
-        if book.id.value not in self._storage:
-            raise ValueError(f"Book with ID {book.id.value} not found")
-        self._storage[book.id.value] = book.to_dict()
+        if book.id not in self._titles:
+            raise ValueError(f"Book with ID {book.id} not found")
+        book_data = book.to_dict()
+        self._index.discard(book.id, self._reconstruct(book.id))
+        self._index.add(book.id, book_data)
+        self._insert(book.id, book_data)
+        self._version += 1
 
     def delete(self, book_id: str) -> None:
-        if book_id not in self._storage:
+        if book_id not in self._titles:
             raise ValueError(f"Book with ID {book_id} not found")
-        del self._storage[book_id]
+        self._index.discard(book_id, self._reconstruct(book_id))
+        del self._titles[book_id]
+        del self._authors[book_id]
+        del self._years[book_id]
+        del self._meta[book_id]
+        self._version += 1
 
     def list_all(self) -> list[Book]:
-        return [Book.from_dict(book_data) for book_data in self._storage.values()]
+        return list(self.iter_all())
+
+    def iter_all(self) -> Iterator[Book]:
+        for book_id in self._titles:
+            yield Book.from_trusted_dict(self._reconstruct(book_id))
+
+    def iter_all_raw(self) -> Iterator[dict]:
+        for book_id in self._titles:
+            yield self._reconstruct(book_id)
 
     def search(self, query: str, field: str) -> list[Book]:
-        if field not in {"title", "author", "year"}:
+        if field not in _VALID_SEARCH_FIELDS:
             raise ValueError(f"Invalid search field: {field}")
 
-        results = []
-        for book_data in self._storage.values():
-            if field == "year":
-                try:
-                    if int(query) == book_data["year"]:
-                        results.append(Book.from_dict(book_data))
-                except ValueError:
-                    continue
-            elif str(query).lower() in str(book_data[field]).lower():
-                results.append(Book.from_dict(book_data))
-        return results
+        memo_key = (query, field)
+        hit = self._search_memo.get(memo_key)
+        if hit is not None and hit[0] == self._version:
+            # Copy so a caller mutating its result list can't poison
+            # later hits; the Book objects themselves are shared.
+            return list(hit[1])
+
+        if field == "year":
+            results = self._search_year(query)
+        else:
+            results = self._search_text(query.lower(), field)
+
+        memo = self._search_memo
+        if len(memo) >= _SEARCH_MEMO_SIZE:
+            # Evict the oldest entry; dicts preserve insertion order.
+            del memo[next(iter(memo))]
+        memo[memo_key] = (self._version, results)
+        return list(results)
+
+    def _search_year(self, query: str) -> list[Book]:
+        """Exact-match years through the hash index."""
+        try:
+            year = int(query)
+        except ValueError:
+            return []
+        return [
+            Book.from_trusted_dict(self._reconstruct(book_id))
+            for book_id in sorted(self._index.year_ids(year))
+        ]
+
+    def _search_text(self, query_lc: str, field: str) -> list[Book]:
+        """Case-insensitive substring match through the trigram index."""
+        candidate_ids = self._index.candidates(query_lc, field)
+        if candidate_ids is None:
+            # Too short for the trigram index: one corpus sweep.
+            return [
+                Book.from_trusted_dict(self._reconstruct(book_id))
+                for book_id in self._index.scan(query_lc, field)
+            ]
+        return [
+            Book.from_trusted_dict(self._reconstruct(book_id))
+            for book_id in sorted(candidate_ids)
+            if query_lc in self._index.text(book_id, field)
+        ]
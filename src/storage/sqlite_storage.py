@@ -0,0 +1,192 @@
+# src/storage/sqlite_storage.py
+import sqlite3
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+
+from src.models.book import Book
+
+from .abstract import AbstractStorage
+from .json_storage import _VALID_SEARCH_FIELDS, StorageError
+
+# Column order shared by the schema, SELECTs and dict reconstruction.
+_COLUMNS = ("id", "title", "author", "year", "status", "created_at", "updated_at")
+
+_SELECT = f"SELECT {', '.join(_COLUMNS)} FROM books"
+
+# books holds the rows; books_fts is an external-content FTS5 index over
+# title/author kept in sync by triggers, so every mutation is an O(log N)
+# B-tree update instead of a full file rewrite.
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS books (
+    id TEXT PRIMARY KEY,
+    title TEXT NOT NULL,
+    author TEXT NOT NULL,
+    year INTEGER NOT NULL,
+    status TEXT NOT NULL,
+    created_at TEXT NOT NULL,
+    updated_at TEXT NOT NULL
+);
+CREATE VIRTUAL TABLE IF NOT EXISTS books_fts USING fts5(
+    title, author, content='books', content_rowid='rowid'
+);
+CREATE TRIGGER IF NOT EXISTS books_ai AFTER INSERT ON books BEGIN
+    INSERT INTO books_fts(rowid, title, author)
+    VALUES (new.rowid, new.title, new.author);
+END;
+CREATE TRIGGER IF NOT EXISTS books_ad AFTER DELETE ON books BEGIN
+    INSERT INTO books_fts(books_fts, rowid, title, author)
+    VALUES ('delete', old.rowid, old.title, old.author);
+END;
+CREATE TRIGGER IF NOT EXISTS books_au AFTER UPDATE ON books BEGIN
+    INSERT INTO books_fts(books_fts, rowid, title, author)
+    VALUES ('delete', old.rowid, old.title, old.author);
+    INSERT INTO books_fts(rowid, title, author)
+    VALUES (new.rowid, new.title, new.author);
+END;
+"""
+
+
+class SQLiteStorage(AbstractStorage):
+    """
+    SQLite-backed implementation of book storage.
+
+    Rows live in a regular table indexed by primary key; title/author
+    text is additionally indexed in an FTS5 virtual table, so search is
+    an index probe rather than a scan.  FTS matching works on word
+    boundaries: a query matches rows whose text contains its words as a
+    phrase, with the last word treated as a prefix.
+    """
+
+    __slots__ = ("_conn", "file_path")
+
+    def __init__(self, file_path: str | Path) -> None:
+        """
+        Initialize SQLite storage.
+
+        Args:
+            file_path: Path to the SQLite database file
+        """
+        self.file_path = Path(file_path)
+        if not self.file_path.parent.is_dir():
+            self.file_path.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            # Autocommit connection: WAL journaling allows concurrent
+            # readers during writes, NORMAL sync skips the per-commit
+            # fsync of the main database file.
+            self._conn = sqlite3.connect(self.file_path, isolation_level=None)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.executescript(_SCHEMA)
+        except sqlite3.Error as e:
+            raise StorageError(f"Failed to open storage database: {e}") from e
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        self._conn.close()
+
+    @contextmanager
+    def buffered(self) -> Iterator["SQLiteStorage"]:
+        """
+        Batch mutations into a single transaction.
+
+        One commit for the whole batch replaces a journal round-trip
+        per mutation.
+        """
+        self._conn.execute("BEGIN")
+        try:
+            yield self
+        except BaseException:
+            self._conn.execute("ROLLBACK")
+            raise
+        else:
+            self._conn.execute("COMMIT")
+
+    def add(self, book: Book) -> None:
+        try:
+            self._conn.execute(
+                "INSERT INTO books VALUES (?, ?, ?, ?, ?, ?, ?)",
+                tuple(book.to_dict().values()),
+            )
+        except sqlite3.IntegrityError:
+            raise ValueError(f"Book with ID {book.id} already exists") from None
+        except sqlite3.Error as e:
+            raise StorageError(f"Failed to save to storage: {e}") from e
+
+    def get(self, book_id: str) -> Book | None:
+        try:
+            row = self._conn.execute(_SELECT + " WHERE id = ?", (book_id,)).fetchone()
+        except sqlite3.Error as e:
+            raise StorageError(f"Failed to load storage: {e}") from e
+        if row is None:
+            return None
+        return Book.from_trusted_dict(dict(zip(_COLUMNS, row, strict=True)))
+
+    def update(self, book: Book) -> None:
+        book_data = book.to_dict()
+        try:
+            cursor = self._conn.execute(
+                "UPDATE books SET title = ?, author = ?, year = ?, status = ?,"
+                " created_at = ?, updated_at = ? WHERE id = ?",
+                (*list(book_data.values())[1:], book.id),
+            )
+        except sqlite3.Error as e:
+            raise StorageError(f"Failed to save to storage: {e}") from e
+        if cursor.rowcount == 0:
+            raise ValueError(f"Book with ID {book.id} not found")
+
+    def delete(self, book_id: str) -> None:
+        try:
+            cursor = self._conn.execute("DELETE FROM books WHERE id = ?", (book_id,))
+        except sqlite3.Error as e:
+            raise StorageError(f"Failed to save to storage: {e}") from e
+        if cursor.rowcount == 0:
+            raise ValueError(f"Book with ID {book_id} not found")
+
+    def list_all(self) -> list[Book]:
+        return list(self.iter_all())
+
+    def iter_all(self) -> Iterator[Book]:
+        for book_data in self.iter_all_raw():
+            yield Book.from_trusted_dict(book_data)
+
+    def iter_all_raw(self) -> Iterator[dict]:
+        try:
+            cursor = self._conn.execute(_SELECT)
+        except sqlite3.Error as e:
+            raise StorageError(f"Failed to load storage: {e}") from e
+        for row in cursor:
+            yield dict(zip(_COLUMNS, row, strict=True))
+
+    def search(self, query: str, field: str) -> list[Book]:
+        if field not in _VALID_SEARCH_FIELDS:
+            raise ValueError(f"Invalid search field: {field}")
+
+        if not query:
+            # An empty query matches everything, mirroring the substring
+            # backends; FTS5 would reject an empty phrase.
+            return self.list_all()
+
+        try:
+            if field == "year":
+                try:
+                    year = int(query)
+                except ValueError:
+                    return []
+                cursor = self._conn.execute(_SELECT + " WHERE year = ?", (year,))
+            else:
+                # Quote the query as one FTS5 phrase (doubling embedded
+                # quotes) so user text can't be parsed as match syntax;
+                # the trailing * makes the final word a prefix match.
+                phrase = '"{}"*'.format(query.replace('"', '""'))
+                cursor = self._conn.execute(
+                    _SELECT + " WHERE rowid IN"
+                    f" (SELECT rowid FROM books_fts WHERE {field} MATCH ?)",
+                    (phrase,),
+                )
+            return [
+                Book.from_trusted_dict(dict(zip(_COLUMNS, row, strict=True)))
+                for row in cursor
+            ]
+        except sqlite3.Error as e:
+            raise StorageError(f"Failed to load storage: {e}") from e
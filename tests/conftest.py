@@ -1,4 +1,5 @@
 # tests/conftest.py
+import copy
 import io
 import sys
 from collections.abc import Generator
@@ -10,6 +11,7 @@ from unittest.mock import Mock
 import pytest
 from _pytest.monkeypatch import MonkeyPatch
 from rich.console import Console
+from rich.table import Table
 
 from src.cli.app import BookManagerCLI
 from src.cli.commands.add import AddCommand
@@ -19,65 +21,105 @@ from src.cli.commands.list import ListCommand
 from src.cli.commands.search import SearchCommand
 from src.cli.commands.status import StatusCommand
 from src.cli.output import ConsoleOutput, OutputFormatter
-from src.models.book import Book, BookStatus
+from src.models.book import (
+    Author,
+    Book,
+    BookId,
+    BookStatus,
+    BookTitle,
+    PublicationYear,
+)
 from src.storage.abstract import AbstractStorage
 from src.storage.json_storage import InMemoryStorage, JsonStorage
+from src.storage.sqlite_storage import SQLiteStorage
 
+# Fixed starting instant used by the mocked clock below.
+_INITIAL_TIME = datetime(2024, 1, 1, 12, 0, 0, tzinfo=UTC)
+_TIME_INCREMENT = 1  # increment in minutes
 
-@pytest.fixture
-def mock_current_time(monkeypatch) -> datetime:
+
+class MockDatetime:
+    """datetime stand-in whose now() advances a fixed mock clock.
+
+    Defined once at module scope: building the class (and its two
+    descriptors) per test was pure fixture overhead, so the fixture
+    only resets the clock state.
     """
-    Fixture that mocks the current time for consistent testing.
 
-    Args:
-        monkeypatch: pytest's monkeypatch fixture
+    _current_time = _INITIAL_TIME
 
-    Returns:
-        Fixed datetime object
+    @classmethod
+    def now(cls, tz=None):
+        cls._current_time += timedelta(minutes=_TIME_INCREMENT)
+        return cls._current_time
+
+    @classmethod
+    def fromisoformat(cls, date_string):
+        return datetime.fromisoformat(date_string)
+
+
+@pytest.fixture(autouse=True, scope="session")
+def _mock_clock() -> Generator[None, None, None]:
     """
-    initial_time = datetime(2024, 1, 1, 12, 0, 0, tzinfo=UTC)
-    time_increment = 1  # increment in minutes
+    Patch the domain clock once for the whole session.
 
-    class MockDatetime:
-        _current_time = initial_time
+    Re-applying monkeypatch per test re-ran its setattr bookkeeping on
+    every setup and teardown; one session-wide context pays that cost a
+    single time.  Individual tests reset the clock state through
+    ``mock_current_time``.
+    """
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr("src.models.book.datetime", MockDatetime)
+        mp.setattr("src.models.base._CURRENT_YEAR", _INITIAL_TIME.year)
+        yield
 
-        @classmethod
-        def now(cls, tz=None):
-            cls._current_time += timedelta(minutes=time_increment)
-            return cls._current_time
 
-        @classmethod
-        def fromisoformat(cls, date_string):
-            return datetime.fromisoformat(date_string)
+@pytest.fixture(scope="session")
+def mock_current_time() -> datetime:
+    """
+    Fixture exposing the frozen instant the mocked clock starts from.
 
-    monkeypatch.setattr("src.models.book.datetime", MockDatetime)
-    return initial_time
+    Session-scoped: the value is a constant, and no test depends on the
+    clock being rewound between runs — they only compare timestamps
+    relative to each other or to the pinned current year.
 
+    Returns:
+        Fixed datetime object
+    """
+    return _INITIAL_TIME
 
-@pytest.fixture
+
+@pytest.fixture(scope="module")
 def valid_book_data() -> dict[str, Any]:
     """
     Fixture that returns valid book data for testing.
 
+    Module-scoped: consumers only read from it (or copy it first).
+
     Returns:
         Dictionary containing valid book data
     """
     return {"title": "The Great Gatsby", "author": "F. Scott Fitzgerald", "year": 1925}
 
 
+@pytest.fixture(scope="class")
+def _class_valid_book(valid_book_data, mock_current_time) -> Book:
+    """One Book.create per test class; valid_book hands out copies."""
+    return Book.create(**valid_book_data)
+
+
 @pytest.fixture
-def valid_book(valid_book_data, mock_current_time) -> Book:
+def valid_book(_class_valid_book) -> Book:
     """
     Fixture that returns a valid Book instance.
 
-    Args:
-        valid_book_data: Dictionary with valid book data (fixture)
-        mock_current_time: Mocked datetime for consistent testing
+    Each test gets a deep copy of the class-scoped book, so mutating
+    tests stay isolated without paying Book.create per test.
 
     Returns:
         Valid Book instance
     """
-    return Book.create(**valid_book_data)
+    return copy.deepcopy(_class_valid_book)
 
 
 @pytest.fixture
@@ -96,20 +138,56 @@ def borrowed_book(valid_book, mock_current_time) -> Book:
     return valid_book
 
 
+_SAMPLE_BOOKS_DATA = [
+    {"title": "The Great Gatsby", "author": "F. Scott Fitzgerald", "year": 1925},
+    {"title": "1984", "author": "George Orwell", "year": 1949},
+    {"title": "Pride and Prejudice", "author": "Jane Austen", "year": 1813},
+]
+
+
+def _make_sample_books() -> list[Book]:
+    """Build fresh Book instances for the standard sample library."""
+    return [Book.create(**data) for data in _SAMPLE_BOOKS_DATA]
+
+
+@pytest.fixture(scope="module")
+def _sample_books_cached() -> tuple[Book, ...]:
+    """Sample books created and validated once per test module."""
+    return tuple(_make_sample_books())
+
+
 @pytest.fixture
-def sample_books(mock_current_time) -> list[Book]:
+def sample_books(_sample_books_cached) -> list[Book]:
     """
     Fixture that returns a list of sample books for testing.
 
+    The books are deep copies of a module-scoped cache, so consuming
+    tests may mutate them without re-paying Book.create validation.
+
     Returns:
         List of Book instances
     """
-    books_data = [
-        {"title": "The Great Gatsby", "author": "F. Scott Fitzgerald", "year": 1925},
-        {"title": "1984", "author": "George Orwell", "year": 1949},
-        {"title": "Pride and Prejudice", "author": "Jane Austen", "year": 1813},
-    ]
-    return [Book.create(**data) for data in books_data]
+    return [copy.deepcopy(book) for book in _sample_books_cached]
+
+
+@pytest.fixture(scope="session")
+def _books_snapshot() -> InMemoryStorage:
+    """Storage pre-populated with the sample library, built once per session."""
+    snapshot = InMemoryStorage()
+    for book in _make_sample_books():
+        snapshot.add(book)
+    return snapshot
+
+
+@pytest.fixture
+def populated_storage(_books_snapshot) -> InMemoryStorage:
+    """
+    Cheap per-test copy of the pre-populated snapshot.
+
+    Copying the snapshot's column dicts is far cheaper than re-running
+    Book.create and validation for every parametrized case.
+    """
+    return copy.copy(_books_snapshot)
 
 
 @pytest.fixture
@@ -124,18 +202,51 @@ def value_objects(valid_book) -> dict[str, Any]:
         Dictionary containing instances of all value objects
     """
     return {
-        "book_id": valid_book.id,
-        "title": valid_book.title,
-        "author": valid_book.author,
-        "year": valid_book.year,
+        "book_id": BookId(valid_book.id),
+        "title": BookTitle(valid_book.title),
+        "author": Author(valid_book.author),
+        "year": PublicationYear(valid_book.year),
     }
 
 
-@pytest.fixture
+def pytest_addoption(parser) -> None:
+    parser.addoption(
+        "--no-json-flush",
+        action="store_true",
+        help="Serve JsonStorage tests from the in-memory cache, skipping disk writes",
+    )
+
+
+@pytest.fixture(autouse=True)
+def _no_json_flush(request, monkeypatch):
+    """
+    Optionally keep JsonStorage mutations in memory.
+
+    With --no-json-flush, storage-agnostic tests skip the per-mutation
+    WAL append and the compaction on flush: _log only marks the cache
+    dirty, which is enough for reads to keep coming from the cache.
+    TestJsonStorageSpecific is exempt since it asserts on-disk behavior.
+    """
+    if not request.config.getoption("--no-json-flush"):
+        return
+    if request.cls is not None and request.cls.__name__ == "TestJsonStorageSpecific":
+        return
+
+    def _mark_dirty(self, op, book_id, book_data=None) -> None:
+        self._dirty = True
+
+    monkeypatch.setattr(JsonStorage, "_log", _mark_dirty)
+    monkeypatch.setattr(JsonStorage, "_flush", lambda self: None)
+
+
+@pytest.fixture(scope="module")
 def invalid_book_data() -> dict[str, dict[str, Any]]:
     """
     Fixture that returns various invalid book data for negative testing.
 
+    Module-scoped: consumers only read from it, so one dictionary can
+    serve every test in a module.
+
     Returns:
         Dictionary containing different cases of invalid book data
     """
@@ -155,17 +266,19 @@ def storage_file(tmp_path) -> Path:
     return tmp_path / "test_storage.json"
 
 
-@pytest.fixture(params=[JsonStorage, InMemoryStorage])
+@pytest.fixture(params=[JsonStorage, InMemoryStorage, SQLiteStorage])
 def storage(request, storage_file) -> AbstractStorage:
     """
-    Parametrized fixture providing both storage implementations.
+    Parametrized fixture providing all storage implementations.
 
-    For JsonStorage, uses a temporary file.
+    For the file-backed storages, uses a temporary file.
     For InMemoryStorage, the file parameter is ignored.
     """
     storage_class: type[AbstractStorage] = request.param
     if storage_class == JsonStorage:
         return JsonStorage(storage_file)
+    if storage_class == SQLiteStorage:
+        return SQLiteStorage(storage_file.with_suffix(".db"))
     return InMemoryStorage()
 
 
@@ -245,7 +358,7 @@ def rich_console(monkeypatch: MonkeyPatch) -> Console:
     """Fixture providing a Rich console with captured output."""
     output = io.StringIO()
     console = Console(file=output, force_terminal=True)
-    monkeypatch.setattr("src.cli.output.Console", lambda: console)
+    monkeypatch.setattr("src.cli.output._ensure_rich", lambda: (lambda: console, Table))
     return console
 
 
@@ -304,7 +417,7 @@ def cli_app(storage, cli_commands) -> BookManagerCLI:
 def mock_console(monkeypatch) -> Mock:
     """Fixture providing a mocked Rich console."""
     console = Mock(spec=Console)
-    monkeypatch.setattr("src.cli.output.Console", lambda: console)
+    monkeypatch.setattr("src.cli.output._ensure_rich", lambda: (lambda: console, Table))
     return console
 
 
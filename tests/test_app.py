@@ -68,7 +68,7 @@ class TestBookManagerCLI:
         def mock_list(*args, **kwargs):
             raise StorageError("Test error")
 
-        monkeypatch.setattr(storage, "list_all", mock_list)
+        monkeypatch.setattr(type(storage), "iter_all_raw", mock_list)
         exit_code = cli_app.run(["list"])
         assert exit_code == 1  # Changed from 2 to 1 for storage errors
 
@@ -78,7 +78,7 @@ class TestBookManagerCLI:
         def mock_list(*args, **kwargs):
             raise RuntimeError("Unexpected error")
 
-        monkeypatch.setattr(storage, "list_all", mock_list)
+        monkeypatch.setattr(type(storage), "iter_all_raw", mock_list)
         exit_code = cli_app.run(["list"])
         assert exit_code == 1  # Changed from 3 to 1 for unexpected errors
 
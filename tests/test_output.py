@@ -1,16 +1,26 @@
 # tests/cli/test_output.py
-from unittest.mock import Mock, call
+from unittest.mock import call
 
 from rich.table import Table
 
 from src.cli.commands.base import CommandResult
-from src.cli.output import ConsoleOutput, MultiOutput, OutputFormatter
+from src.cli.output import ConsoleOutput, MultiOutput
 
 # Constants for test assertions
 EXPECTED_PRINTS_FOR_STATUS_TEST = 4  # 2 messages + 2 tables
 EXPECTED_PRINTS_FOR_EMPTY_TEST = 2  # Only message printed
 
 
+class _StubFormatter:
+    """Records the last display/error call; cheaper than Mock(spec=...)."""
+
+    def display(self, result: CommandResult) -> None:
+        self.result = result
+
+    def error(self, message: str) -> None:
+        self.message = message
+
+
 class TestConsoleOutput:
     """Test cases for ConsoleOutput."""
 
@@ -54,6 +64,15 @@ class TestConsoleOutput:
         assert table.show_header is True
         assert table.header_style == "bold magenta"
 
+        # Assert on the table's own bookkeeping: no render pass needed
+        assert table.row_count == len(sample_data["multiple"])
+        assert [column.header for column in table.columns] == [
+            "Id",
+            "Title",
+            "Author",
+            "Status",
+        ]
+
     def test_display_dict_data(self, mock_console, sample_data):
         """Test displaying dictionary data."""
         output = ConsoleOutput()
@@ -127,8 +146,8 @@ class TestMultiOutput:
 
     def test_multiple_formatters(self):
         """Test multiple formatter handling."""
-        formatter1 = Mock(spec=OutputFormatter)
-        formatter2 = Mock(spec=OutputFormatter)
+        formatter1 = _StubFormatter()
+        formatter2 = _StubFormatter()
         output = MultiOutput(formatter1, formatter2)
         result = CommandResult(success=True, message="Test")
 
@@ -137,8 +156,8 @@ class TestMultiOutput:
 
         # Check both formatters received the calls
         for formatter in (formatter1, formatter2):
-            formatter.display.assert_called_once_with(result)
-            formatter.error.assert_called_once_with("Test error")
+            assert formatter.result is result
+            assert formatter.message == "Test error"
 
     def test_no_formatters(self):
         """Test behavior with no formatters."""